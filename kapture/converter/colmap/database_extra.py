@@ -18,7 +18,7 @@ import kapture
 from kapture.io.features import image_keypoints_from_file
 
 # local
-from .database import COLMAPDatabase, image_ids_to_pair_id, pair_id_to_image_ids
+from .database import COLMAPDatabase, image_ids_to_pair_id, pair_id_to_image_ids, array_to_blob
 from .cameras import get_colmap_camera
 from .export_colmap_reconstruction import export_to_colmap_txt
 
@@ -46,6 +46,27 @@ def foreign_keys_on(database: COLMAPDatabase) -> sqlite3.dbapi2.Cursor:
     return database.execute("PRAGMA foreign_keys = on;")
 
 
+def get_next_autoincrement_id(database: COLMAPDatabase, table: str, key: str) -> int:
+    """
+    Get the identifier sqlite would assign to the next row inserted in an AUTOINCREMENT table.
+     Useful to insert rows in bulk (executemany) while still knowing their identifiers.
+
+    :param database: colmap database
+    :param table: name of the table (eg. cameras)
+    :param key: name of the autoincrement column (eg. camera_id)
+    :return: next identifier
+    """
+    next_id = database.execute(f'SELECT IFNULL(MAX({key}), 0) + 1 FROM {table};').fetchone()[0]
+    try:
+        sequence = database.execute('SELECT seq FROM sqlite_sequence WHERE name = ?;', (table,)).fetchone()
+    except sqlite3.OperationalError:
+        # sqlite_sequence does not exist yet
+        sequence = None
+    if sequence is not None:
+        next_id = max(next_id, sequence[0] + 1)
+    return next_id
+
+
 def get_camera_ids_from_database(database: COLMAPDatabase) -> List[int]:
     """
     Get the list of colmap camera ids
@@ -336,15 +357,17 @@ def add_cameras_to_database(sensors: kapture.Sensors, database: COLMAPDatabase)
                for cam_id, camera in sensors.items()
                if isinstance(camera, kapture.Camera)}
 
-    for cam_id, cam in cameras.items():
-        col_cam_id, width, height, params, prior_focal_length = get_colmap_camera(cam)
-        colmap_camera_ids[cam_id] = database.add_camera(
-            col_cam_id,
-            width,
-            height,
-            params,
-            prior_focal_length=prior_focal_length)
+    next_camera_id = get_next_autoincrement_id(database, 'cameras', 'camera_id')
+    for colmap_camera_id, cam_id in enumerate(cameras, start=next_camera_id):
+        colmap_camera_ids[cam_id] = colmap_camera_id
+
+    def _cameras_rows():
+        for cam_id, cam in cameras.items():
+            model, width, height, params, prior_focal_length = get_colmap_camera(cam)
+            params = np.asarray(params, np.float64)
+            yield colmap_camera_ids[cam_id], model, width, height, array_to_blob(params), prior_focal_length
 
+    database.executemany('INSERT INTO cameras VALUES (?, ?, ?, ?, ?, ?)', _cameras_rows())
     database.commit()
     return colmap_camera_ids
 
@@ -410,11 +433,16 @@ def add_images_from_list_in_colmap_format(database: COLMAPDatabase,
     :return: dict mapping kapture image ids to colmap image ids.
     """
     colmap_image_ids = {}  # colmap_image_ids[name] = ids
-    for name, cam_id, prior_q, prior_t in image_list:
-        colmap_image_ids[name] = database.add_image(
-            name, cam_id,
-            prior_q=prior_q,
-            prior_t=prior_t)
+    next_image_id = get_next_autoincrement_id(database, 'images', 'image_id')
+    for colmap_image_id, (name, _, _, _) in enumerate(image_list, start=next_image_id):
+        colmap_image_ids[name] = colmap_image_id
+
+    database.executemany(
+        'INSERT INTO images VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)',
+        ((colmap_image_ids[name], name, cam_id,
+          prior_q[0], prior_q[1], prior_q[2], prior_q[3],
+          prior_t[0], prior_t[1], prior_t[2])
+         for name, cam_id, prior_q, prior_t in image_list))
     database.commit()
     return colmap_image_ids
 
@@ -505,14 +533,18 @@ def add_keypoints_to_database(database: COLMAPDatabase,
     :param colmap_image_ids: kapture camera identifier -> colmap camera identifier dictionary
     """
     keypoints_filepaths = kapture.io.features.keypoints_to_filepaths(keypoints, kapture_dir_path)
-    for image_filename, keypoints_filepath in keypoints_filepaths.items():
-        image_keypoints = image_keypoints_from_file(keypoints_filepath, keypoints.dtype, keypoints.dsize)
-        colmap_image_id = colmap_image_ids[image_filename]
-        # Make sure keypoints are np.float32 and support by colmap
-        if image_keypoints.shape[1] not in {2, 4, 6}:
-            image_keypoints = image_keypoints[:, 0:2]
-        image_keypoints = image_keypoints.astype(np.float32)
-        database.add_keypoints(colmap_image_id, image_keypoints)
+
+    def _keypoints_rows():
+        for image_filename, keypoints_filepath in keypoints_filepaths.items():
+            image_keypoints = image_keypoints_from_file(keypoints_filepath, keypoints.dtype, keypoints.dsize)
+            colmap_image_id = colmap_image_ids[image_filename]
+            # Make sure keypoints are np.float32 and support by colmap
+            if image_keypoints.shape[1] not in {2, 4, 6}:
+                image_keypoints = image_keypoints[:, 0:2]
+            image_keypoints = np.ascontiguousarray(image_keypoints, dtype=np.float32)
+            yield (colmap_image_id,) + image_keypoints.shape + (memoryview(image_keypoints),)
+
+    database.executemany('INSERT INTO keypoints VALUES (?, ?, ?, ?)', _keypoints_rows())
     database.commit()
 
 
@@ -529,10 +561,15 @@ def add_descriptors_to_database(database: COLMAPDatabase,
     :param colmap_image_ids: kapture camera identifier -> colmap camera identifier dictionary
     """
     descriptors_filepaths = kapture.io.features.descriptors_to_filepaths(descriptors, kapture_dir_path)
-    for image_filename, descriptors_filepath in descriptors_filepaths.items():
-        image_descriptors = image_keypoints_from_file(descriptors_filepath, descriptors.dtype, descriptors.dsize)
-        colmap_image_id = colmap_image_ids[image_filename]
-        database.add_descriptors(colmap_image_id, image_descriptors)
+
+    def _descriptors_rows():
+        for image_filename, descriptors_filepath in descriptors_filepaths.items():
+            image_descriptors = image_keypoints_from_file(descriptors_filepath, descriptors.dtype, descriptors.dsize)
+            colmap_image_id = colmap_image_ids[image_filename]
+            image_descriptors = np.ascontiguousarray(image_descriptors, dtype=np.uint8)
+            yield (colmap_image_id,) + image_descriptors.shape + (memoryview(image_descriptors),)
+
+    database.executemany('INSERT INTO descriptors VALUES (?, ?, ?, ?)', _descriptors_rows())
     database.commit()
 
 
@@ -7,6 +7,8 @@ This script exports data from kapture to COLMAP database and/or reconstruction f
 import logging
 import os
 import os.path as path
+import sqlite3
+import sys
 from typing import Optional
 import warnings
 
@@ -31,7 +33,8 @@ def export_colmap(kapture_dirpath: str,
                   colmap_database_filepath: str,
                   colmap_reconstruction_dirpath: Optional[str],
                   colmap_rig_filepath: str = None,
-                  force_overwrite_existing: bool = False) -> None:
+                  force_overwrite_existing: bool = False,
+                  in_memory_database: bool = False) -> None:
     """
     Exports kapture data to colmap database and or reconstruction text files.
 
@@ -40,6 +43,8 @@ def export_colmap(kapture_dirpath: str,
     :param colmap_reconstruction_dirpath: path to colmap reconstruction directory
     :param colmap_rig_filepath: path to colmap rig file
     :param force_overwrite_existing: Silently overwrite colmap files if already exists.
+    :param in_memory_database: If True, builds the database in memory, then writes it to file at once.
+                               Faster, but requires enough memory to hold the whole database.
     """
 
     os.makedirs(path.dirname(colmap_database_filepath), exist_ok=True)
@@ -48,16 +53,36 @@ def export_colmap(kapture_dirpath: str,
 
     assert colmap_database_filepath
     if path.isfile(colmap_database_filepath):
+        if not force_overwrite_existing and (sys.stdin is None or not sys.stdin.isatty()):
+            # do not block on a prompt nobody can answer (eg. batch exports).
+            raise ValueError('{} already exist, use force_overwrite_existing to overwrite it.'
+                             .format(colmap_database_filepath))
         to_delete = force_overwrite_existing or (input(
             'database file already exist, would you like to delete it ? [y/N]').lower() == 'y')
         if to_delete:
             logger.info('deleting already existing {}'.format(colmap_database_filepath))
             os.remove(colmap_database_filepath)
 
+    if in_memory_database and path.isfile(colmap_database_filepath):
+        logger.warning('cannot build the database in memory: {} already exists'.format(colmap_database_filepath))
+        in_memory_database = False
+    if in_memory_database and sqlite3.sqlite_version_info < (3, 27, 0):
+        logger.warning('cannot build the database in memory: sqlite >= 3.27 is required for VACUUM INTO')
+        in_memory_database = False
+
     logger.info('creating colmap database in {}'.format(colmap_database_filepath))
-    db = COLMAPDatabase.connect(colmap_database_filepath)
+    db = COLMAPDatabase.connect(':memory:' if in_memory_database else colmap_database_filepath)
     if not is_colmap_db_empty(db):
         raise ValueError('the existing colmap database is not empty : {}'.format(colmap_database_filepath))
+    # the database is written once, in bulk: trade durability for speed.
+    # No journal is safe here: on failure, the (empty at start) database is deleted, see below.
+    for pragma in ('PRAGMA journal_mode=OFF;',
+                   'PRAGMA synchronous=OFF;',
+                   'PRAGMA locking_mode=EXCLUSIVE;',
+                   'PRAGMA temp_store=MEMORY;',
+                   'PRAGMA cache_size=-524288;',  # 512MB
+                   'PRAGMA mmap_size=268435456;'):  # 256MB
+        db.execute(pragma)
 
     logger.info('loading kapture files...')
     kapture_data = csv.kapture_from_dir(kapture_dirpath)
@@ -70,7 +95,20 @@ def export_colmap(kapture_dirpath: str,
         rigs_remove_inplace(kapture_data.trajectories, kapture_data.rigs)
 
     # write colmap database
-    kapture_to_colmap(kapture_data, kapture_dirpath, db)
+    try:
+        kapture_to_colmap(kapture_data, kapture_dirpath, db)
+        db.commit()
+        if in_memory_database:
+            # write the whole database to file in a single sequential pass.
+            logger.info('writing colmap database to {}'.format(colmap_database_filepath))
+            db.execute('VACUUM INTO ?;', (colmap_database_filepath,))
+    except BaseException:
+        # without journal, the database may be left corrupted, even on interruption (Ctrl-C): remove it.
+        # In memory, the target file did not exist before, it can only be a partial VACUUM INTO.
+        db.close()
+        if path.isfile(colmap_database_filepath):
+            os.remove(colmap_database_filepath)
+        raise
 
     if colmap_reconstruction_dirpath:
         # create text files
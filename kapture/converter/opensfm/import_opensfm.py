@@ -1,17 +1,37 @@
 import logging
 import os
 import os.path as path
+import sys
 import numpy as np
 import quaternion
-import gzip
 import pickle
 import json
+from array import array
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from itertools import repeat
+from operator import itemgetter
 from tqdm import tqdm
-from typing import Optional, Dict
+try:
+    # ISA-L is a much faster drop-in replacement of gzip
+    from isal import igzip as gzip
+except ModuleNotFoundError:
+    import gzip
+try:
+    import orjson
+    has_orjson = True
+except ModuleNotFoundError:
+    has_orjson = False
+try:
+    import ijson
+    has_ijson = True
+except ModuleNotFoundError:
+    has_ijson = False
+from typing import Any, Optional, Dict, List, Tuple
 # kapture
 import kapture
 from kapture.io.structure import delete_existing_kapture_files
 from kapture.io.csv import kapture_to_dir
+from kapture.utils.paths import find_files_with_suffix
 from kapture.io.features import get_keypoints_fullpath, image_keypoints_from_file
 from kapture.io.features import get_descriptors_fullpath, image_descriptors_from_file
 from kapture.io.features import get_matches_fullpath, image_matches_from_file
@@ -23,6 +43,9 @@ from kapture.io.structure import delete_existing_kapture_files
 
 logger = logging.getLogger('opensfm')
 
+# reconstruction files larger than this are streamed (if ijson is available) rather than loaded at once.
+STREAMED_RECONSTRUCTION_MIN_FILESIZE = 512 * 1024 * 1024
+
 """
 opensfm_project/
 ├── config.yaml
@@ -92,6 +115,122 @@ POINT: {
 """
 
 
+def load_json(filepath: str):
+    """
+    Loads a json file, using orjson (much faster on large files) if available.
+
+    :param filepath: path to the json file
+    :return: the parsed json content
+    """
+    if has_orjson:
+        with open(filepath, 'rb') as f:
+            return orjson.loads(f.read())
+    with open(filepath, 'rt') as f:
+        return json.load(f)
+
+
+def opensfm_points_to_array(
+        opensfm_points: Dict[str, Dict[str, List[float]]]
+) -> np.ndarray:
+    """
+    Converts OpenSfM points into a Nx6 array (x, y, z, r, g, b), sorted by point id.
+
+    :param opensfm_points: OpenSfM points, as in reconstruction.json
+    :return: points array
+    """
+    # fill a single preallocated array, avoiding a python list per point.
+    points_data = np.empty((len(opensfm_points), kapture.Points3d.XYZRGB), dtype=np.float64)
+    # keep points sorted by (string) id: the point index is its identifier in kapture.
+    opensfm_points_sorted = sorted(opensfm_points.items(), key=itemgetter(0))
+    for i, (_, point_data) in enumerate(opensfm_points_sorted):
+        points_data[i, 0:3] = point_data['coordinates']
+        points_data[i, 3:6] = point_data['color']
+    return points_data
+
+
+def _build_json_value(json_events) -> Any:
+    """
+    Builds the next json value (scalar, object or list) out of ijson parsing events.
+
+    :param json_events: iterator on ijson (prefix, event, value) parsing events
+    :return: the json value
+    """
+    builder = ijson.ObjectBuilder()
+    depth = 0
+    for _, event, value in json_events:
+        builder.event(event, value)
+        if event in ('start_map', 'start_array'):
+            depth += 1
+        elif event in ('end_map', 'end_array'):
+            depth -= 1
+        if depth == 0:
+            return builder.value
+
+
+def load_opensfm_reconstruction_streamed(
+        filepath: str
+) -> Tuple[Dict[str, Any], Optional[np.ndarray]]:
+    """
+    Loads the first reconstruction of an OpenSfM reconstruction.json, streaming the file with ijson.
+    Points are directly packed into a compact buffer, instead of a dict per point:
+    this keeps memory low on very large reconstructions.
+
+    :param filepath: path to reconstruction.json
+    :return: the reconstruction (without points), and the points array sorted by id (None if no points)
+    """
+    opensfm_reconstruction = {}
+    point_ids, points_data = None, None
+    with open(filepath, 'rb') as f:
+        json_events = ijson.parse(f, use_float=True)
+        for prefix, event, value in json_events:
+            if prefix == 'item' and event == 'end_map':
+                # only the first reconstruction is imported
+                break
+            if prefix != 'item' or event != 'map_key':
+                continue
+            if value != 'points':
+                opensfm_reconstruction[value] = _build_json_value(json_events)
+                continue
+            point_ids, points_data = [], array('d')
+            for point_prefix, point_event, point_id in json_events:
+                if point_event == 'end_map' and point_prefix == 'item.points':
+                    break
+                if point_event == 'map_key':
+                    point_data = _build_json_value(json_events)
+                    point_ids.append(point_id)
+                    points_data.extend(point_data['coordinates'])
+                    points_data.extend(point_data['color'])
+
+    if points_data is None:
+        return opensfm_reconstruction, None
+    points_data = np.frombuffer(points_data, dtype=np.float64).reshape(-1, kapture.Points3d.XYZRGB)
+    # keep points sorted by (string) id: the point index is its identifier in kapture.
+    points_order = sorted(range(len(point_ids)), key=point_ids.__getitem__)
+    return opensfm_reconstruction, points_data[points_order]
+
+
+def load_opensfm_reconstruction(
+        filepath: str
+) -> Tuple[Dict[str, Any], Optional[np.ndarray]]:
+    """
+    Loads the first reconstruction of an OpenSfM reconstruction.json.
+    Large files are streamed if ijson is available (see load_opensfm_reconstruction_streamed).
+
+    :param filepath: path to reconstruction.json
+    :return: the reconstruction (without points), and the points array sorted by id (None if no points)
+    """
+    if has_ijson and path.getsize(filepath) >= STREAMED_RECONSTRUCTION_MIN_FILESIZE:
+        return load_opensfm_reconstruction_streamed(filepath)
+
+    opensfm_reconstruction = load_json(filepath)
+    # remove the single list @ root
+    opensfm_reconstruction = opensfm_reconstruction[0]
+    opensfm_points = opensfm_reconstruction.pop('points', None)
+    if opensfm_points is None:
+        return opensfm_reconstruction, None
+    return opensfm_reconstruction, opensfm_points_to_array(opensfm_points)
+
+
 def import_camera(
         opensfm_camera: Dict[str, float],
         name: Optional[str] = None
@@ -121,6 +260,87 @@ def import_camera(
         raise ValueError(f'unable to convert camera of type {opensfm_camera["projection_type"]}')
 
 
+def load_opensfm_exif_gps(
+        opensfm_exif_filepath: str
+) -> Optional[Dict[str, float]]:
+    """
+    Loads the gps data of an OpenSfM exif file.
+
+    :param opensfm_exif_filepath: path to the OpenSfM exif file (.exif)
+    :return: the gps data (longitude, latitude, ...), or None if no gps data in file
+    """
+    return load_json(opensfm_exif_filepath).get('gps')
+
+
+def import_opensfm_image_features(
+        opensfm_features_filepath: str,
+        image_filename: str,
+        kapture_rootdir: str
+) -> Tuple[str, int, np.dtype, int, np.dtype]:
+    """
+    Converts the OpenSfM features file of a single image into kapture keypoints and descriptors files.
+
+    :param opensfm_features_filepath: path to the OpenSfM features file (.features.npz)
+    :param image_filename: name of the image the features belong to
+    :param kapture_rootdir: kapture top directory
+    :return: image_filename, keypoints dsize, keypoints dtype, descriptors dsize, descriptors dtype
+    """
+    logger.debug(f'parsing keypoints and descriptors in {opensfm_features_filepath}')
+    opensfm_image_features = np.load(opensfm_features_filepath)
+    # make sure arrays are written to file as a single contiguous block
+    opensfm_image_keypoints = np.ascontiguousarray(opensfm_image_features['points'])
+    opensfm_image_descriptors = np.ascontiguousarray(opensfm_image_features['descriptors'])
+
+    # convert keypoints file
+    keypoint_filpath = kapture.io.features.get_features_fullpath(
+        data_type=kapture.Keypoints, kapture_dirpath=kapture_rootdir, image_filename=image_filename)
+    kapture.io.features.image_keypoints_to_file(
+        filepath=keypoint_filpath, image_keypoints=opensfm_image_keypoints)
+
+    # convert descriptors file
+    descriptor_filpath = kapture.io.features.get_features_fullpath(
+        data_type=kapture.Descriptors, kapture_dirpath=kapture_rootdir, image_filename=image_filename)
+    kapture.io.features.image_descriptors_to_file(
+        filepath=descriptor_filpath, image_descriptors=opensfm_image_descriptors)
+
+    return (image_filename,
+            opensfm_image_keypoints.shape[1], opensfm_image_keypoints.dtype,
+            opensfm_image_descriptors.shape[1], opensfm_image_descriptors.dtype)
+
+
+def import_opensfm_image_matches(
+        opensfm_matches_filepath: str,
+        image_filename_1: str,
+        kapture_rootdir: str
+) -> List[Tuple[str, str]]:
+    """
+    Converts the OpenSfM matches file of a single image into kapture matches files.
+
+    :param opensfm_matches_filepath: path to the OpenSfM matches file (_matches.pkl.gz)
+    :param image_filename_1: name of the image the matches file belongs to
+    :param kapture_rootdir: kapture top directory
+    :return: list of image pairs converted
+    """
+    logger.debug(f'parsing mathes in {image_filename_1}')
+    image_pairs = []
+    # decompress the whole file at once: faster than streaming pickle through gzip
+    with open(opensfm_matches_filepath, 'rb') as f:
+        opensfm_matches = pickle.loads(gzip.decompress(f.read()))
+    for image_filename_2, opensfm_image_matches in opensfm_matches.items():
+        image_pair = (image_filename_1, image_filename_2)
+        image_pairs.append(image_pair)
+        # convert the bin file to kapture
+        kapture_matches_filepath = kapture.io.features.get_matches_fullpath(
+            image_filename_pair=image_pair,
+            kapture_dirpath=kapture_rootdir)
+        kapture_image_matches = np.empty((opensfm_image_matches.shape[0], 3), dtype=np.float64)
+        kapture_image_matches[:, 0:2] = opensfm_image_matches
+        # no macthes scoring = assume all to one
+        kapture_image_matches[:, 2] = 1.0
+        kapture.io.features.image_matches_to_file(kapture_matches_filepath, kapture_image_matches)
+    return image_pairs
+
+
 def import_opensfm(
         opensfm_rootdir: str,
         kapture_rootdir: str,
@@ -130,10 +350,7 @@ def import_opensfm(
     disable_tqdm = logger.getEffectiveLevel() != logging.INFO
     # load reconstruction
     opensfm_reconstruction_filepath = path.join(opensfm_rootdir, 'reconstruction.json')
-    with open(opensfm_reconstruction_filepath, 'rt') as f:
-        opensfm_reconstruction = json.load(f)
-    # remove the single list @ root
-    opensfm_reconstruction = opensfm_reconstruction[0]
+    opensfm_reconstruction, opensfm_points_data = load_opensfm_reconstruction(opensfm_reconstruction_filepath)
 
     # prepare space for output
     os.makedirs(kapture_rootdir, exist_ok=True)
@@ -143,9 +360,12 @@ def import_opensfm(
     kapture_sensors = kapture.Sensors()
     assert 'cameras' in opensfm_reconstruction
     # import cameras
+    # shots refer to cameras by id: share a single (interned) string per camera id.
+    sensor_ids = {}
     for osfm_camera_id, osfm_camera in opensfm_reconstruction['cameras'].items():
-        camera = import_camera(osfm_camera, name=osfm_camera_id)
-        kapture_sensors[osfm_camera_id] = camera
+        sensor_ids[osfm_camera_id] = sensor_id = sys.intern(osfm_camera_id)
+        camera = import_camera(osfm_camera, name=sensor_id)
+        kapture_sensors[sensor_id] = camera
 
     # import shots
     logger.info('importing images and trajectories ...')
@@ -154,18 +374,27 @@ def import_opensfm(
     opensfm_image_dirpath = path.join(opensfm_rootdir, 'images')
     assert 'shots' in opensfm_reconstruction
     image_timestamps, image_sensors = {}, {}  # used later to retrieve the timestamp of an image.
-    for timestamp, (image_filename, shot) in enumerate(opensfm_reconstruction['shots'].items()):
-        sensor_id = shot['camera']
+    opensfm_shots = opensfm_reconstruction['shots']
+    # convert all rotation vectors at once
+    rotation_vectors = np.array([shot['rotation'] for shot in opensfm_shots.values()],
+                                dtype=np.float64).reshape(-1, 3)
+    rotations = quaternion.from_rotation_vector(rotation_vectors)
+    translations = np.array([shot['translation'] for shot in opensfm_shots.values()],
+                            dtype=np.float64).reshape(-1, 3)
+    # in OpenSfm, (sensor, timestamp) is not unique: use the shot index as timestamp.
+    # Each timestamp holds a single shot, so records and trajectories are built in bulk.
+    images_data, trajectories_data = {}, {}
+    for timestamp, (image_filename, shot) in enumerate(opensfm_shots.items()):
+        sensor_id = sensor_ids[shot['camera']]
         image_timestamps[image_filename] = timestamp
         image_sensors[image_filename] = sensor_id
-        # in OpenSfm, (sensor, timestamp) is not unique.
-        rotation_vector = shot['rotation']
-        q = quaternion.from_rotation_vector(rotation_vector)
-        translation = shot['translation']
         # capture_time = shot['capture_time'] # may be invalid
         # gps_position = shot['gps_position']
-        kapture_images[timestamp, sensor_id] = image_filename
-        kapture_trajectories[timestamp, sensor_id] = kapture.PoseTransform(r=q, t=translation)
+        images_data[timestamp] = {sensor_id: image_filename}
+        trajectories_data[timestamp] = {sensor_id: kapture.PoseTransform(r=rotations[timestamp],
+                                                                         t=translations[timestamp])}
+    kapture_images.update(images_data)
+    kapture_trajectories.update(trajectories_data)
 
     # copy image files
     filename_list = [f for _, _, f in kapture.flatten(kapture_images)]
@@ -188,31 +417,33 @@ def import_opensfm(
             kapture_sensors[gnss_id] = kapture.Sensor(sensor_type='gnss', sensor_params=['EPSG:4326'])
         # build epsg_code for all cameras
         kapture_gnss = kapture.RecordsGnss()
-        opensfm_exif_filepath_list = (path.join(dirpath, filename)
-                                      for dirpath, _, filename_list in os.walk(opensfm_exif_dirpath)
-                                      for filename in filename_list
-                                      if filename.endswith(opensfm_exif_suffix))
-        for opensfm_exif_filepath in tqdm(opensfm_exif_filepath_list, disable=disable_tqdm):
-            image_filename = path.relpath(opensfm_exif_filepath, opensfm_exif_dirpath)[:-len(opensfm_exif_suffix)]
-            image_timestamp = image_timestamps[image_filename]
-            image_sensor_id = image_sensors[image_filename]
-            gnss_timestamp = image_timestamp
-            gnss_sensor_id = map_cam_to_gnss_sensor[image_sensor_id]
-            with open(opensfm_exif_filepath, 'rt') as f:
-                js_root = json.load(f)
-                if 'gps' not in js_root:
+        # gnss record key (timestamp, sensor_id) for each image, to retrieve it with a single lookup.
+        image_gnss_keys = {image_filename: (image_timestamps[image_filename],
+                                            map_cam_to_gnss_sensor[image_sensor_id])
+                           for image_filename, image_sensor_id in image_sensors.items()}
+        opensfm_exif_filepath_list = list(find_files_with_suffix(opensfm_exif_dirpath, opensfm_exif_suffix))
+        # paths are prefixed with the exif dir: relative path + suffix removal is a simple slice.
+        image_filename_slice = slice(len(path.join(opensfm_exif_dirpath, '')), -len(opensfm_exif_suffix))
+        # exif files are small: reading them is I/O bound, read them concurrently.
+        with ThreadPoolExecutor() as executor:
+            js_gps_list = executor.map(load_opensfm_exif_gps, opensfm_exif_filepath_list)
+            # kapture records are not thread safe: fill them from the main thread.
+            for opensfm_exif_filepath, js_gps in tqdm(zip(opensfm_exif_filepath_list, js_gps_list),
+                                                      total=len(opensfm_exif_filepath_list), disable=disable_tqdm):
+                image_filename = opensfm_exif_filepath[image_filename_slice]
+                gnss_timestamp, gnss_sensor_id = image_gnss_keys[image_filename]
+                if js_gps is None:
                     logger.warning(f'NO GPS data in "{opensfm_exif_filepath}"')
                     continue
 
-                gps_coords = {
-                    'x': js_root['gps']['longitude'],
-                    'y': js_root['gps']['latitude'],
-                    'z': js_root['gps'].get('altitude', 0.0),
-                    'dop': js_root['gps'].get('dop', 0),
-                    'utc': 0,
-                }
-                logger.debug(f'found GPS data for ({gnss_timestamp}, {gnss_sensor_id}) in "{opensfm_exif_filepath}"')
-                kapture_gnss[gnss_timestamp, gnss_sensor_id] = kapture.RecordGnss(**gps_coords)
+                logger.debug('found GPS data for (%s, %s) in "%s"',
+                             gnss_timestamp, gnss_sensor_id, opensfm_exif_filepath)
+                kapture_gnss[gnss_timestamp, gnss_sensor_id] = kapture.RecordGnss(
+                    x=js_gps['longitude'],
+                    y=js_gps['latitude'],
+                    z=js_gps.get('altitude', 0.0),
+                    dop=js_gps.get('dop', 0),
+                    utc=0)
 
     # import features (keypoints + descriptors)
     kapture_keypoints = None  # kapture.Keypoints(type_name='opensfm', dsize=4, dtype=np.float64)
@@ -221,46 +452,33 @@ def import_opensfm(
     opensfm_features_suffix = '.features.npz'
     if path.isdir(opensfm_features_dirpath):
         logger.info('importing keypoints and descriptors ...')
-        opensfm_features_file_list = (path.join(dp, fn)
-                                      for dp, _, fs in os.walk(opensfm_features_dirpath) for fn in fs)
-        opensfm_features_file_list = (filepath
-                                      for filepath in opensfm_features_file_list
-                                      if filepath.endswith(opensfm_features_suffix))
-        for opensfm_feature_filename in tqdm(opensfm_features_file_list, disable=disable_tqdm):
-            image_filename = path.relpath(opensfm_feature_filename, opensfm_features_dirpath)[
-                             :-len(opensfm_features_suffix)]
-            opensfm_image_features = np.load(opensfm_feature_filename)
-            opensfm_image_keypoints = opensfm_image_features['points']
-            opensfm_image_descriptors = opensfm_image_features['descriptors']
-            logger.debug(f'parsing keypoints and descriptors in {opensfm_feature_filename}')
-            if kapture_keypoints is None:
-                # print(type(opensfm_image_keypoints.dtype))
-                # HAHOG = Hessian Affine feature point detector + HOG descriptor
-                kapture_keypoints = kapture.Keypoints(
-                    type_name='HessianAffine',
-                    dsize=opensfm_image_keypoints.shape[1],
-                    dtype=opensfm_image_keypoints.dtype)
-            if kapture_descriptors is None:
-                kapture_descriptors = kapture.Descriptors(
-                    type_name='HOG',
-                    dsize=opensfm_image_descriptors.shape[1],
-                    dtype=opensfm_image_descriptors.dtype)
-
-            # convert keypoints file
-            keypoint_filpath = kapture.io.features.get_features_fullpath(
-                data_type=kapture.Keypoints, kapture_dirpath=kapture_rootdir, image_filename=image_filename)
-            kapture.io.features.image_keypoints_to_file(
-                filepath=keypoint_filpath, image_keypoints=opensfm_image_keypoints)
-            # register the file
-            kapture_keypoints.add(image_filename)
-
-            # convert descriptors file
-            descriptor_filpath = kapture.io.features.get_features_fullpath(
-                data_type=kapture.Descriptors, kapture_dirpath=kapture_rootdir, image_filename=image_filename)
-            kapture.io.features.image_descriptors_to_file(
-                filepath=descriptor_filpath, image_descriptors=opensfm_image_descriptors)
-            # register the file
-            kapture_descriptors.add(image_filename)
+        opensfm_features_file_list = list(find_files_with_suffix(opensfm_features_dirpath,
+                                                                 opensfm_features_suffix))
+        image_filename_slice = slice(len(path.join(opensfm_features_dirpath, '')), -len(opensfm_features_suffix))
+        image_filename_list = [opensfm_feature_filename[image_filename_slice]
+                               for opensfm_feature_filename in opensfm_features_file_list]
+        # files are independent from each other: convert them in parallel.
+        with ProcessPoolExecutor() as executor:
+            features_infos = executor.map(import_opensfm_image_features,
+                                          opensfm_features_file_list,
+                                          image_filename_list,
+                                          repeat(kapture_rootdir))
+            for image_filename, keypoints_dsize, keypoints_dtype, descriptors_dsize, descriptors_dtype in tqdm(
+                    features_infos, total=len(opensfm_features_file_list), disable=disable_tqdm):
+                if kapture_keypoints is None:
+                    # HAHOG = Hessian Affine feature point detector + HOG descriptor
+                    kapture_keypoints = kapture.Keypoints(
+                        type_name='HessianAffine',
+                        dsize=keypoints_dsize,
+                        dtype=keypoints_dtype)
+                if kapture_descriptors is None:
+                    kapture_descriptors = kapture.Descriptors(
+                        type_name='HOG',
+                        dsize=descriptors_dsize,
+                        dtype=descriptors_dtype)
+                # register the files
+                kapture_keypoints.add(image_filename)
+                kapture_descriptors.add(image_filename)
 
     # import matches
     kapture_matches = kapture.Matches()
@@ -268,42 +486,26 @@ def import_opensfm(
     opensfm_matches_dirpath = path.join(opensfm_rootdir, 'matches')
     if path.isdir(opensfm_matches_dirpath):
         logger.info('importing matches ...')
-        opensfm_matches_file_list = (path.join(dp, fn)
-                                     for dp, _, fs in os.walk(opensfm_matches_dirpath) for fn in fs)
-        opensfm_matches_file_list = (filepath
-                                     for filepath in opensfm_matches_file_list
-                                     if filepath.endswith(opensfm_matches_suffix))
-
-        for opensfm_matches_filename in tqdm(opensfm_matches_file_list, disable=disable_tqdm):
-            image_filename_1 = path.relpath(opensfm_matches_filename, opensfm_matches_dirpath)[
-                               :-len(opensfm_matches_suffix)]
-            logger.debug(f'parsing mathes in {image_filename_1}')
-            with gzip.open(opensfm_matches_filename, 'rb') as f:
-                opensfm_matches = pickle.load(f)
-                for image_filename_2, opensfm_image_matches in opensfm_matches.items():
-                    image_pair = (image_filename_1, image_filename_2)
+        opensfm_matches_file_list = list(find_files_with_suffix(opensfm_matches_dirpath,
+                                                                opensfm_matches_suffix))
+        image_filename_slice = slice(len(path.join(opensfm_matches_dirpath, '')), -len(opensfm_matches_suffix))
+        image_filename_list = [opensfm_matches_filename[image_filename_slice]
+                               for opensfm_matches_filename in opensfm_matches_file_list]
+        # files are independent from each other: convert them in parallel.
+        with ProcessPoolExecutor() as executor:
+            image_pairs_list = executor.map(import_opensfm_image_matches,
+                                            opensfm_matches_file_list,
+                                            image_filename_list,
+                                            repeat(kapture_rootdir))
+            for image_pairs in tqdm(image_pairs_list, total=len(opensfm_matches_file_list), disable=disable_tqdm):
+                for image_pair in image_pairs:
                     # register the pair to kapture
                     kapture_matches.add(*image_pair)
-                    # convert the bin file to kapture
-                    kapture_matches_filepath = kapture.io.features.get_matches_fullpath(
-                        image_filename_pair=image_pair,
-                        kapture_dirpath=kapture_rootdir)
-                    kapture_image_matches = np.hstack([
-                        opensfm_image_matches.astype(np.float64),
-                        # no macthes scoring = assume all to one
-                        np.ones(shape=(opensfm_image_matches.shape[0], 1), dtype=np.float64)])
-                    kapture.io.features.image_matches_to_file(kapture_matches_filepath, kapture_image_matches)
 
     # import 3-D points
-    if 'points' in opensfm_reconstruction:
+    if opensfm_points_data is not None:
         logger.info('importing points 3-D')
-        opensfm_points = opensfm_reconstruction['points']
-        points_data = []
-        for point_id in sorted(opensfm_points):
-            point_data = opensfm_points[point_id]
-            point_data = point_data['coordinates'] + point_data['color']
-            points_data.append(point_data)
-        kapture_points = kapture.Points3d(points_data)
+        kapture_points = kapture.Points3d(opensfm_points_data)
     else:
         kapture_points = None
 
@@ -4,11 +4,13 @@
 This files contains IO operations on Record related data.
 """
 
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from enum import auto
 import logging
 import os
 import os.path as path
 import shutil
+import threading
 from typing import Tuple, Any, Dict, Type, Optional, Union, Iterable, List
 from tqdm import tqdm
 
@@ -21,6 +23,8 @@ logger = getLogger()
 
 # Records files related functions ######################################################################################
 RECORD_DATA_DIRNAME = path_secure(path.join('sensors', 'records_data'))
+# files are copied concurrently by chunks: a task per file costs more than copying a small file.
+TRANSFER_CHUNK_SIZE = 256
 
 
 class TransferAction(AutoEnum):
@@ -69,6 +73,35 @@ def transfer_files_from_dir_link(
             raise e
 
 
+def _transfer_files_copy_chunk(
+        transfers: List[Tuple[str, str]],
+        force_overwrite: bool,
+        delete_source: bool,
+        stop_event: threading.Event
+) -> int:
+    """
+    Copies (or moves) a chunk of files, see transfer_files_from_dir_copy.
+    Stops before the next file if stop_event is set, and sets it on failure, to stop the other chunks.
+
+    :return: number of files in chunk
+    """
+    try:
+        for src, dst in transfers:
+            if stop_event.is_set():
+                break
+            os.makedirs(path.dirname(dst), exist_ok=True)
+            if force_overwrite and path.lexists(dst):
+                os.remove(dst)
+            if delete_source:
+                shutil.move(src, dst)
+            else:
+                shutil.copyfile(src, dst)
+    except BaseException:
+        stop_event.set()
+        raise
+    return len(transfers)
+
+
 def transfer_files_from_dir_copy(
         source_filepath_list: Iterable[str],
         destination_filepath_list: Iterable[str],
@@ -79,6 +112,9 @@ def transfer_files_from_dir_copy(
     Transfer every files by copying given from the source list to destination list.
     The matching between source and kapture files are explicitly given.
     If delete_source is activated, it moves files instead copying them.
+    Large lists are copied concurrently, by chunks of TRANSFER_CHUNK_SIZE files.
+    On the first error, remaining chunks are not transferred and the error is raised.
+    Moves are sequential: they are cheap (mostly renames) and must stop at the first error.
 
     :param source_filepath_list: input list of absolute path to source files.
     :param destination_filepath_list: input list of absolute path to destination files.
@@ -86,14 +122,29 @@ def transfer_files_from_dir_copy(
     :param delete_source: if True, delete the imported files from source_record_dirpath.
     """
     hide_progress_bar = logger.getEffectiveLevel() > logging.INFO
-    for src, dst in tqdm(zip(source_filepath_list, destination_filepath_list), disable=hide_progress_bar):
-        os.makedirs(path.dirname(dst), exist_ok=True)
-        if force_overwrite and path.lexists(dst):
-            os.remove(dst)
-        if delete_source:
-            shutil.move(src, dst)
-        else:
-            shutil.copyfile(src, dst)
+    transfers = list(zip(source_filepath_list, destination_filepath_list))
+    chunks = [transfers[i:i + TRANSFER_CHUNK_SIZE] for i in range(0, len(transfers), TRANSFER_CHUNK_SIZE)]
+    stop_event = threading.Event()
+    with tqdm(total=len(transfers), disable=hide_progress_bar) as progress_bar:
+        if delete_source or len(chunks) <= 1:
+            # not worth a thread pool
+            for src, dst in transfers:
+                progress_bar.update(_transfer_files_copy_chunk([(src, dst)], force_overwrite, delete_source,
+                                                               stop_event))
+            return
+
+        with ThreadPoolExecutor() as executor:
+            futures = [executor.submit(_transfer_files_copy_chunk, chunk, force_overwrite, delete_source, stop_event)
+                       for chunk in chunks]
+            try:
+                for future in as_completed(futures):
+                    progress_bar.update(future.result())
+            except BaseException:
+                # stop as soon as possible: cancel pending chunks, and interrupt running ones.
+                stop_event.set()
+                for future in futures:
+                    future.cancel()
+                raise
 
 
 def transfer_files_from_dir(
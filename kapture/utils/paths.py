@@ -70,6 +70,25 @@ def populate_files_in_dirpath(root_dirpath: str,
     return filepaths
 
 
+def find_files_with_suffix(root_dirpath: str, suffix: str) -> Iterable[str]:
+    """
+    Returns the full path of all files, into the given root path, whose name ends with the given suffix.
+    Uses os.scandir, that gets the file type from the directory listing, without an extra stat per file.
+
+    :param root_dirpath: the root directory path
+    :param suffix: file name suffix to filter in (eg. '.features.npz')
+    :return: full paths (root_dirpath joined with relative path) of matching files
+    """
+    dirpaths_to_scan = [root_dirpath]
+    while dirpaths_to_scan:
+        with os.scandir(dirpaths_to_scan.pop()) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    dirpaths_to_scan.append(entry.path)
+                elif entry.name.endswith(suffix):
+                    yield entry.path
+
+
 def safe_remove_file(filepath: str, force: bool) -> None:
     """
     Safely remove a file, optionally asking confirmation to the user on the command line.
@@ -1,7 +1,9 @@
 #!/usr/bin/env python3
 # Copyright 2020-present NAVER Corp. Under BSD 3-clause license
 
+import io
 import unittest
+from unittest.mock import patch
 import os.path as path
 import tempfile
 import numpy as np
@@ -313,6 +315,60 @@ class TestColmapMaupertuis(unittest.TestCase):
         self.assertIs(kapture_data.points3d, None)
         self.assertIs(kapture_data.observations, None)
 
+    def test_maupertuis_export_db_only_in_memory(self):
+        # export/import and check
+        colmap_db_filepath = path.join(self._temp_dirpath, 'colmap.db')
+        export_colmap(
+            kapture_dirpath=self._kapture_dirpath,
+            colmap_database_filepath=colmap_db_filepath,
+            colmap_reconstruction_dirpath=None,
+            colmap_rig_filepath=None,
+            force_overwrite_existing=True,
+            in_memory_database=True)
+
+        kapture_data = import_colmap(
+            kapture_dirpath=self._temp_dirpath,
+            colmap_database_filepath=colmap_db_filepath,
+            colmap_reconstruction_dirpath=None,
+            colmap_images_dirpath=None,
+            force_overwrite_existing=True,
+            no_geometric_filtering=True
+        )
+
+        # check the numbers
+        self.assertEqual(1, len(kapture_data.sensors))
+        self.assertEqual(4, len(kapture_data.trajectories))
+        self.assertEqual(4, len(kapture_data.records_camera))
+        self.assertEqual(4, len(kapture_data.keypoints))
+        self.assertEqual(4, len(kapture_data.descriptors))
+        self.assertEqual(6, len(kapture_data.matches))
+
+    def test_maupertuis_export_interrupted(self):
+        # an interrupted export (eg. Ctrl-C) must not leave a partial database behind
+        colmap_db_filepath = path.join(self._temp_dirpath, 'colmap.db')
+        for in_memory_database in [False, True]:
+            with patch('kapture.converter.colmap.export_colmap.kapture_to_colmap', side_effect=KeyboardInterrupt):
+                self.assertRaises(KeyboardInterrupt, export_colmap,
+                                  kapture_dirpath=self._kapture_dirpath,
+                                  colmap_database_filepath=colmap_db_filepath,
+                                  colmap_reconstruction_dirpath=None,
+                                  force_overwrite_existing=True,
+                                  in_memory_database=in_memory_database)
+            self.assertFalse(path.exists(colmap_db_filepath))
+
+    def test_maupertuis_export_existing_non_interactive(self):
+        # an existing database must not trigger a prompt when stdin is not a terminal
+        colmap_db_filepath = path.join(self._temp_dirpath, 'colmap.db')
+        with open(colmap_db_filepath, 'w'):
+            pass
+        with patch('sys.stdin', io.StringIO()):
+            self.assertRaises(ValueError, export_colmap,
+                              kapture_dirpath=self._kapture_dirpath,
+                              colmap_database_filepath=colmap_db_filepath,
+                              colmap_reconstruction_dirpath=None,
+                              force_overwrite_existing=False)
+        self.assertTrue(path.isfile(colmap_db_filepath))
+
     def test_maupertuis_export(self):
         # export/import and check
         colmap_db_filepath = path.join(self._temp_dirpath, 'colmap.db')
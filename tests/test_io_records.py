@@ -6,6 +6,7 @@ import os
 import os.path as path
 import sys
 import tempfile
+from unittest.mock import patch
 # kapture
 import path_to_kapture  # enables import kapture
 import kapture
@@ -59,6 +60,33 @@ class TestRecordCopy(unittest.TestCase):
         for origin_filepath in origin_filepaths:
             self.assertTrue(path.isfile(origin_filepath))
 
+    def test_copy_chunks(self):
+        origin_filepaths = [path_secure(path.join(self._source_dirpath, filename))
+                            for filename in self._filenames]
+        expected_filepaths = [kapture.io.records.get_image_fullpath(self._dest_dirpath, filename)
+                              for filename in self._filenames]
+        # force several chunks, to use the thread pool
+        with patch('kapture.io.records.TRANSFER_CHUNK_SIZE', 4):
+            kapture.io.records.transfer_files_from_dir_copy(origin_filepaths, expected_filepaths)
+
+        for origin_filepath, expected_filepath in zip(origin_filepaths, expected_filepaths):
+            self.assertTrue(path.isfile(expected_filepath))
+            with open(origin_filepath) as f_origin, open(expected_filepath) as f_expected:
+                self.assertEqual(f_origin.read(), f_expected.read())
+
+    def test_move_stops_on_error(self):
+        origin_filepaths = [path_secure(path.join(self._source_dirpath, filename))
+                            for filename in self._filenames]
+        expected_filepaths = [kapture.io.records.get_image_fullpath(self._dest_dirpath, filename)
+                              for filename in self._filenames]
+        os.remove(origin_filepaths[0])
+        with patch('kapture.io.records.TRANSFER_CHUNK_SIZE', 4):
+            self.assertRaises(FileNotFoundError, kapture.io.records.transfer_files_from_dir_copy,
+                              origin_filepaths, expected_filepaths, delete_source=True)
+        # nothing moved after the first error
+        for origin_filepath in origin_filepaths[1:]:
+            self.assertTrue(path.isfile(origin_filepath))
+
 
 class TestRecordLinkAbs(unittest.TestCase):
     def setUp(self):
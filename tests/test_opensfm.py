@@ -8,12 +8,14 @@ import os
 import os.path as path
 import tempfile
 import unittest
+import numpy as np
 # kapture
 import path_to_kapture  # enables import kapture
 import kapture
 from kapture.algo.compare import equal_kapture, equal_sensors, equal_records_gnss
 import kapture.io.csv as csv
 from kapture.io.records import TransferAction, get_image_fullpath
+import kapture.converter.opensfm.import_opensfm as import_opensfm_module
 from kapture.converter.opensfm.import_opensfm import import_opensfm
 from kapture.converter.opensfm.export_opensfm import export_opensfm
 
@@ -60,6 +62,21 @@ class TestOpenSfM(unittest.TestCase):
         # check all at once
         self.assertTrue(equal_kapture(kapture_data_expected, kapture_data_actual))
 
+    @unittest.skipIf(not import_opensfm_module.has_ijson, "ijson module is missing")
+    def test_load_reconstruction_streamed(self) -> None:
+        """
+        Test the streamed loading of reconstruction.json gives the same result as the regular one
+        """
+        reconstruction_filepath = path.join(self._opensfm_sample_path, 'reconstruction.json')
+        with open(reconstruction_filepath, 'rt') as f:
+            reconstruction_expected = json.load(f)[0]
+        reconstruction_actual, points_actual = \
+            import_opensfm_module.load_opensfm_reconstruction_streamed(reconstruction_filepath)
+        points_expected = import_opensfm_module.opensfm_points_to_array(reconstruction_expected.pop('points'))
+        self.assertEqual(reconstruction_expected, reconstruction_actual)
+        self.assertEqual(points_expected.shape, points_actual.shape)
+        self.assertTrue(np.array_equal(points_expected, points_actual))
+
     def test_export_opensfm(self) -> None:
         """
         Test the import_openmvg function on a small JSON file while linking the images
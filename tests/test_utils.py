@@ -48,6 +48,20 @@ class TestUtils(unittest.TestCase):
             first_line = f.readline()
             self.assertEqual(additional, first_line, "Successful prepend")
 
+    def testFindFilesWithSuffix(self):
+        with tempfile.TemporaryDirectory() as tmpdirname:
+            expected_filepaths = {path.join(tmpdirname, 'a.jpg.exif'),
+                                  path.join(tmpdirname, 'sub', 'b.jpg.exif'),
+                                  path.join(tmpdirname, 'sub', 'subsub', 'c.jpg.exif')}
+            other_filepaths = {path.join(tmpdirname, 'a.jpg'),
+                               path.join(tmpdirname, 'sub', 'b.exif.txt')}
+            for filepath in expected_filepaths | other_filepaths:
+                os.makedirs(path.dirname(filepath), exist_ok=True)
+                with open(filepath, 'w') as f_dst:
+                    f_dst.write('some content')
+            actual_filepaths = set(kapture.utils.paths.find_files_with_suffix(tmpdirname, '.exif'))
+            self.assertEqual(expected_filepaths, actual_filepaths)
+
     def tearDown(self) -> None:
         """
         Clean up after every test
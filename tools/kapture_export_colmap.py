@@ -40,6 +40,8 @@ def colmap_command_line():
                         help='text reconstruction output path.')
     parser.add_argument('-rig', '--rig',
                         help='json rig output path.')
+    parser.add_argument('--in-memory', action='store_true', default=False,
+                        help='build the database in memory before writing it to file (faster, but uses more memory).')
     ####################################################################################################################
     args = parser.parse_args()
 
@@ -53,7 +55,7 @@ def colmap_command_line():
         for k, v in vars(args).items()))
 
     logger.info('exporting colmap ...')
-    export_colmap(args.kapture, args.database, args.reconstruction, args.rig, args.force)
+    export_colmap(args.kapture, args.database, args.reconstruction, args.rig, args.force, args.in_memory)
     logger.info('done.')
 
 